@@ -1,7 +1,15 @@
 """CICD Workflow - CI/CD workflows and agents for Claude Code projects."""
 
-try:
-    from importlib.metadata import version
-    __version__ = version("workflows-manager")
-except Exception:
-    __version__ = "0.3.3"
+
+def __getattr__(name: str):
+    # __version__ is resolved on first access: importlib.metadata is by far
+    # the most expensive import on the CLI startup path.
+    if name == "__version__":
+        try:
+            from importlib.metadata import version
+            value = version("workflows-manager")
+        except Exception:
+            value = "0.3.3"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,7 +15,23 @@ import argparse
 import os
 import sys
 
-from wfm import __version__, workflow_manager
+import wfm
+from wfm import platform as plat
+from wfm import workflow_manager
+
+WFM_REPO = "dgx80/workflows-manager"
+
+
+class _VersionAction(argparse.Action):
+    """Like argparse's "version" action, but reads wfm.__version__ only when used."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        # Like argparse's own version action: print to stdout, then exit 0
+        sys.stdout.write(f"wfm {wfm.__version__}\n")
+        parser.exit()
 
 
 def main():
@@ -24,7 +40,7 @@ def main():
         prog="wfm",
         description="Workflow Manager for Claude Code - manage skills and workflows via local repos"
     )
-    parser.add_argument("-V", "--version", action="version", version=f"wfm {__version__}")
+    parser.add_argument("-V", "--version", action=_VersionAction, help="show program's version number and exit")
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
@@ -145,11 +161,14 @@ def cmd_sync(args):
                 print(f"    Workflows: {', '.join(workflows)}")
             print(f"    Path: {repo_result.get('repo_path', 'N/A')}")
 
-    # Handle orphan skills
+    # Repos offered as adoption targets for orphans (one result per configured repo)
+    repos = [repo_result["repo_name"] for repo_result in result.get("results", [])]
     orphan_skills = result.get("orphan_skills", [])
+    orphan_workflows = result.get("orphan_workflows", [])
+
+    # Handle orphan skills
     if orphan_skills:
         print(f"\n[INFO] Detected {len(orphan_skills)} orphan skill(s) (not linked to any repo):")
-        repos = list(workflow_manager.get_configured_repos().keys())
 
         for skill in orphan_skills:
             print(f"\n  Skill: {skill}")
@@ -179,10 +198,8 @@ def cmd_sync(args):
                 print(f"  Skipped.")
 
     # Handle orphan workflows
-    orphan_workflows = result.get("orphan_workflows", [])
     if orphan_workflows:
         print(f"\n[INFO] Detected {len(orphan_workflows)} orphan workflow(s):")
-        repos = list(workflow_manager.get_configured_repos().keys())
 
         for wf in orphan_workflows:
             print(f"\n  Workflow: {wf}")
@@ -219,8 +236,6 @@ def cmd_sync(args):
 
 def cmd_list():
     """Handle list command - list all skills and workflows."""
-    from wfm import platform as plat
-
     repos = workflow_manager.get_configured_repos()
 
     if not repos:
@@ -239,11 +254,13 @@ def cmd_list():
     skills_path = workflow_manager.get_global_skills_path()
     if skills_path.exists():
         skills = []
-        for item in sorted(skills_path.iterdir()):
-            if item.is_dir() and (item / "SKILL.md").exists():
-                is_link = plat.is_link(item)
+        with os.scandir(skills_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            if os.path.exists(os.path.join(entry.path, "SKILL.md")):
+                is_link = plat.is_link_entry(entry)
                 link_marker = "" if is_link else " (orphan)"
-                skills.append(f"  /{item.name}{link_marker}")
+                skills.append(f"  /{entry.name}{link_marker}")
 
         if skills:
             print(f"Skills ({len(skills)}):")
@@ -259,11 +276,13 @@ def cmd_list():
     workflows_path = workflow_manager.get_global_workflows_path()
     if workflows_path.exists():
         workflows = []
-        for item in sorted(workflows_path.iterdir()):
-            if item.is_dir() and (item / "workflow.md").exists():
-                is_link = plat.is_link(item)
+        with os.scandir(workflows_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            if os.path.exists(os.path.join(entry.path, "workflow.md")):
+                is_link = plat.is_link_entry(entry)
                 link_marker = "" if is_link else " (orphan)"
-                workflows.append(f"  {item.name}{link_marker}")
+                workflows.append(f"  {entry.name}{link_marker}")
 
         if workflows:
             print(f"Workflows ({len(workflows)}):")
@@ -279,8 +298,6 @@ def cmd_list():
 
 def cmd_status():
     """Handle status command - show configuration and paths."""
-    from wfm import platform as plat
-
     print("=== WFM Status ===")
     print()
 
@@ -312,21 +329,27 @@ def cmd_status():
 
     skill_count = 0
     orphan_skills = 0
-    if skills_path.exists():
-        for item in skills_path.iterdir():
-            if item.is_dir() and (item / "SKILL.md").exists():
-                skill_count += 1
-                if not plat.is_link(item):
-                    orphan_skills += 1
+    try:
+        with os.scandir(skills_path) as it:
+            for entry in it:
+                if os.path.exists(os.path.join(entry.path, "SKILL.md")):
+                    skill_count += 1
+                    if not plat.is_link_entry(entry):
+                        orphan_skills += 1
+    except OSError:
+        pass
 
     workflow_count = 0
     orphan_workflows = 0
-    if workflows_path.exists():
-        for item in workflows_path.iterdir():
-            if item.is_dir() and (item / "workflow.md").exists():
-                workflow_count += 1
-                if not plat.is_link(item):
-                    orphan_workflows += 1
+    try:
+        with os.scandir(workflows_path) as it:
+            for entry in it:
+                if os.path.exists(os.path.join(entry.path, "workflow.md")):
+                    workflow_count += 1
+                    if not plat.is_link_entry(entry):
+                        orphan_workflows += 1
+    except OSError:
+        pass
 
     print(f"Skills: {skill_count} total, {orphan_skills} orphans")
     print(f"Workflows: {workflow_count} total, {orphan_workflows} orphans")
@@ -345,27 +368,81 @@ def cmd_status():
     return 0
 
 
-def cmd_version():
-    """Handle version command."""
-    import subprocess
+# Latest release tag, cached after the first successful lookup
+_latest_version: str | None = None
+
+
+def get_latest_version(timeout: int = 30) -> str:
+    """Get the latest wfm release version from GitHub.
+
+    Queries the GitHub releases API directly (authenticated with GH_TOKEN or
+    GITHUB_TOKEN when set), which avoids spawning gh. Falls back to
+    'gh release view' if the API request fails, e.g. when it is rate limited
+    or the repo requires gh's stored credentials.
+
+    timeout is split between the two attempts. The API request uses half of
+    it as its socket timeout (applied per connect/read; DNS resolution is not
+    bounded), and gh gets whatever is left of timeout, but never less than
+    the other half, so a hung API request cannot starve the fallback.
+    Successful lookups are cached for the process lifetime.
+
+    Raises:
+        RuntimeError: If both the API request and gh fail (the message
+            reports both errors)
+    """
+    global _latest_version
+    if _latest_version is not None:
+        return _latest_version
+
+    import http.client
     import json
+    import time
+    import urllib.request
 
-    print(f"wfm: {__version__}")
+    deadline = time.monotonic() + timeout
+
+    request = urllib.request.Request(
+        f"https://api.github.com/repos/{WFM_REPO}/releases/latest",
+        headers={"Accept": "application/vnd.github+json"},
+    )
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout / 2) as response:
+            tag = json.loads(response.read()).get("tag_name", "")
+    except (OSError, ValueError, http.client.HTTPException) as api_error:
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                ["gh", "release", "view", "--repo", WFM_REPO, "--json", "tagName"],
+                capture_output=True,
+                text=True,
+                timeout=max(deadline - time.monotonic(), timeout / 2)
+            )
+        except (OSError, subprocess.TimeoutExpired) as gh_error:
+            raise RuntimeError(f"GitHub API: {api_error}; gh: {gh_error}") from gh_error
+        if result.returncode != 0:
+            gh_message = result.stderr.strip() or "gh release view failed"
+            raise RuntimeError(f"GitHub API: {api_error}; gh: {gh_message}")
+        tag = json.loads(result.stdout).get("tagName", "")
+
+    _latest_version = tag.lstrip("v")
+    return _latest_version
+
+
+def cmd_version():
+    """Handle version command."""
+    print(f"wfm: {wfm.__version__}")
 
     # Get latest wfm release from GitHub
     try:
-        result = subprocess.run(
-            ["gh", "release", "view", "--repo", "dgx80/workflows-manager", "--json", "tagName"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            latest_wfm = data.get("tagName", "").lstrip("v")
-            if __version__ != latest_wfm:
-                print(f"Update available: {latest_wfm}")
-                print("Run 'wfm self-update' to update.")
+        latest_wfm = get_latest_version(timeout=10)
+        if wfm.__version__ != latest_wfm:
+            print(f"Update available: {latest_wfm}")
+            print("Run 'wfm self-update' to update.")
     except Exception:
         pass
 
@@ -381,25 +458,13 @@ def cmd_self_update():
 
     # Get latest version from GitHub
     try:
-        result = subprocess.run(
-            ["gh", "release", "view", "--repo", "dgx80/workflows-manager", "--json", "tagName"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode != 0:
-            print("[ERROR] Failed to check latest version")
-            return 1
-
-        import json
-        data = json.loads(result.stdout)
-        latest_version = data.get("tagName", "").lstrip("v")
+        latest_version = get_latest_version()
     except Exception as e:
         print(f"[ERROR] Failed to check latest version: {e}")
         return 1
 
     # Compare with current version
-    current_version = __version__
+    current_version = wfm.__version__
     print(f"Current version: {current_version}")
     print(f"Latest version:  {latest_version}")
 
@@ -420,7 +485,7 @@ def cmd_self_update():
         # Download wheel using gh
         download_cmd = [
             "gh", "release", "download", f"v{latest_version}",
-            "--repo", "dgx80/workflows-manager",
+            "--repo", WFM_REPO,
             "--pattern", wheel_name,
             "--dir", tmpdir
         ]
@@ -6,17 +6,22 @@ Unix/Mac: Uses symlinks
 from __future__ import annotations
 
 import os
-import platform
-import subprocess
 from pathlib import Path
 
 
-def create_link(source: Path, target: Path) -> bool:
+def create_link(
+    source: str | os.PathLike, target: str | os.PathLike, make_parents: bool = True
+) -> bool:
     """Create a junction (Windows) or symlink (Unix) from target to source.
 
+    Paths may be plain strings (e.g. DirEntry.path) or Path objects.
+    On Unix an existing symlink at target is replaced atomically.
+
     Args:
         source: The existing directory to link to (the repo folder)
         target: The link path to create (in ~/.claude/skills/ or workflows/)
+        make_parents: Create target's parent directory if needed; callers that
+            already ensured it can pass False to skip the mkdir
 
     Returns:
         True if successful
@@ -26,19 +31,41 @@ def create_link(source: Path, target: Path) -> bool:
         OSError: If symlink creation fails on Unix
     """
     # Ensure source exists
-    if not source.exists():
+    if not os.path.exists(source):
         raise FileNotFoundError(f"Source directory does not exist: {source}")
 
-    # Remove existing link/directory if present
-    if target.exists() or is_link(target):
+    if os.name != "nt" and os.path.islink(target):
+        # Swap an existing symlink atomically so the entry never goes missing.
+        # The temp name is random per call: threads share a pid, and a crash
+        # can leave a stale temp link behind.
+        for _ in range(10):
+            tmp_target = f"{os.fspath(target)}.wfm-{os.urandom(8).hex()}.tmp"
+            try:
+                os.symlink(source, tmp_target)
+                break
+            except FileExistsError:
+                continue
+        else:
+            raise FileExistsError(f"Could not pick a temporary name next to {target}")
+        try:
+            os.replace(tmp_target, target)
+        except OSError:
+            os.unlink(tmp_target)
+            raise
+        return True
+
+    # Remove existing link/directory if present (lexists also sees dangling links)
+    if os.path.lexists(target):
         remove_link(target)
 
     # Ensure parent directory exists
-    target.parent.mkdir(parents=True, exist_ok=True)
+    if make_parents:
+        os.makedirs(os.path.dirname(os.fspath(target)), exist_ok=True)
 
-    if platform.system() == "Windows":
+    if os.name == "nt":
         # Junction - no admin privileges required
         # mklink /J creates a directory junction
+        import subprocess
         result = subprocess.run(
             ["cmd", "/c", "mklink", "/J", str(target), str(source)],
             check=True,
@@ -52,7 +79,7 @@ def create_link(source: Path, target: Path) -> bool:
         return True
 
 
-def remove_link(path: Path) -> bool:
+def remove_link(path: str | os.PathLike) -> bool:
     """Remove a junction (Windows) or symlink (Unix).
 
     Args:
@@ -61,10 +88,11 @@ def remove_link(path: Path) -> bool:
     Returns:
         True if successful, False if path doesn't exist
     """
-    if not path.exists() and not is_link(path):
+    if not os.path.lexists(path):
         return False
 
-    if platform.system() == "Windows":
+    if os.name == "nt":
+        import subprocess
         # rmdir for junction - does NOT delete the target contents
         if is_link(path):
             subprocess.run(
@@ -82,9 +110,9 @@ def remove_link(path: Path) -> bool:
         return True
     else:
         # Unix - unlink for symlink, rmdir for directory
-        if path.is_symlink():
+        if os.path.islink(path):
             os.unlink(path)
-        elif path.is_dir():
+        elif os.path.isdir(path):
             import shutil
             shutil.rmtree(path)
         else:
@@ -92,7 +120,7 @@ def remove_link(path: Path) -> bool:
         return True
 
 
-def is_link(path: Path) -> bool:
+def is_link(path: str | os.PathLike) -> bool:
     """Check if path is a junction (Windows) or symlink (Unix).
 
     Args:
@@ -101,26 +129,46 @@ def is_link(path: Path) -> bool:
     Returns:
         True if path is a junction or symlink
     """
-    if not path.exists() and not _path_is_reparse_point(path):
-        return False
-
-    if platform.system() == "Windows":
+    if os.name == "nt":
         return _path_is_reparse_point(path)
     else:
-        return path.is_symlink()
+        return os.path.islink(path)
+
+
+def is_link_entry(entry: os.DirEntry) -> bool:
+    """Check if an os.scandir() entry is a junction (Windows) or symlink (Unix).
+
+    Same answer as is_link(entry.path), but reads the attributes scandir
+    already fetched instead of issuing another syscall per entry.
+
+    Args:
+        entry: Directory entry to check
+
+    Returns:
+        True if the entry is a junction or symlink
+    """
+    if os.name == "nt":
+        # DirEntry.is_symlink() misses junctions; the cached lstat result
+        # carries the reparse-point attribute for both
+        try:
+            return bool(entry.stat(follow_symlinks=False).st_file_attributes & 0x400)
+        except OSError:
+            return _path_is_reparse_point(entry.path)
+    else:
+        return entry.is_symlink()
 
 
-def _path_is_reparse_point(path: Path) -> bool:
+def _path_is_reparse_point(path: str | os.PathLike) -> bool:
     """Check if path is a Windows reparse point (junction or symlink).
 
     Uses GetFileAttributesW to check FILE_ATTRIBUTE_REPARSE_POINT (0x400).
     """
-    if platform.system() != "Windows":
+    if os.name != "nt":
         return False
 
     try:
         import ctypes
-        attrs = ctypes.windll.kernel32.GetFileAttributesW(str(path))
+        attrs = ctypes.windll.kernel32.GetFileAttributesW(os.fspath(path))
         if attrs == -1:  # INVALID_FILE_ATTRIBUTES
             return False
         # FILE_ATTRIBUTE_REPARSE_POINT = 0x400
@@ -141,8 +189,9 @@ def get_link_target(path: Path) -> Path | None:
     if not is_link(path):
         return None
 
-    if platform.system() == "Windows":
+    if os.name == "nt":
         # Use dir command to get junction target
+        import subprocess
         try:
             result = subprocess.run(
                 ["cmd", "/c", "dir", str(path.parent), "/AL"],
@@ -10,61 +10,147 @@ Architecture:
 """
 from __future__ import annotations
 
+import contextlib
+import copy
+import errno
+import functools
 import json
-import shutil
+import os
+import re
+import stat
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 
+from wfm import platform as plat
+
 
 # =============================================================================
 # Multi-Repo Config (wfm.json)
 # =============================================================================
 
+# Repo names become skill/workflow prefixes: ASCII alphanumerics and hyphens
+_NAME_RE = re.compile(r"\A[A-Za-z0-9][A-Za-z0-9-]*\Z")
+
+
+@functools.cache
 def get_wfm_config_path() -> Path:
     """Get the wfm.json config path (~/.claude/wfm.json)."""
     return get_global_claude_path() / "wfm.json"
 
 
+# Parsed wfm.json keyed by (st_mtime_ns, st_size); reset on every write
+_WFM_CACHE: tuple[int, int, dict] | None = None
+
+
+def _load_wfm_config() -> dict:
+    """Return the cached, parsed wfm.json without copying it.
+
+    The returned dict is shared with later calls and must not be mutated;
+    use read_wfm_config() for a private copy.
+    """
+    global _WFM_CACHE
+    config_path = get_wfm_config_path()
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return {"repos": {}}
+
+    if _WFM_CACHE is not None and _WFM_CACHE[:2] == (st.st_mtime_ns, st.st_size):
+        return _WFM_CACHE[2]
+
+    try:
+        with open(config_path, "rb") as f:
+            config = json.loads(f.read())
+    except (ValueError, OSError):
+        return {"repos": {}}
+    # Ensure repos key exists
+    if "repos" not in config:
+        config["repos"] = {}
+    _WFM_CACHE = (st.st_mtime_ns, st.st_size, config)
+    return config
+
+
 def read_wfm_config() -> dict:
     """Read multi-repo config from ~/.claude/wfm.json.
 
+    The parsed config is cached in-process and reused while the file's
+    mtime and size are unchanged. Callers get their own copy and may mutate it.
+
     Returns:
         dict with 'repos' key containing name->repo mappings
         Example: {"repos": {"myrepo": "/path/to/repo", "other": "/path/to/other"}}
     """
-    config_path = get_wfm_config_path()
-    if config_path.exists():
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-                # Ensure repos key exists
-                if "repos" not in config:
-                    config["repos"] = {}
-                return config
-        except (json.JSONDecodeError, OSError):
-            return {"repos": {}}
-    return {"repos": {}}
+    return copy.deepcopy(_load_wfm_config())
 
 
 def write_wfm_config(config: dict) -> bool:
-    """Write multi-repo config to ~/.claude/wfm.json."""
+    """Write multi-repo config to ~/.claude/wfm.json.
+
+    The config is written to a uniquely named temp file next to wfm.json and
+    swapped in with os.replace, so a crash or a concurrent wfm run never
+    leaves a truncated wfm.json behind. A symlinked wfm.json (e.g. from a
+    dotfiles repo) is resolved first, so the link's target is what gets
+    replaced and the link itself is kept.
+    """
+    import tempfile
+
+    global _WFM_CACHE
     config_path = get_wfm_config_path()
+    data = json.dumps(config, indent=2).encode("utf-8")
+    _WFM_CACHE = None
+    tmp_path = None
     try:
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        target_path = os.path.realpath(config_path)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix="wfm.", suffix=".json.tmp", dir=os.path.dirname(target_path)
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates the file 0600; keep the mode wfm.json already had,
+        # or give a new one the usual umask-based mode
+        try:
+            mode = stat.S_IMODE(os.stat(target_path).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target_path)
         return True
     except OSError:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
         return False
 
 
+@contextlib.contextmanager
+def mutate_wfm_config() -> Iterator[dict]:
+    """Yield the wfm.json config for in-place edits, writing it back on exit.
+
+    The file is only rewritten if the config actually changed, so a no-op
+    update costs a (cached) read and no write.
+
+    Raises:
+        OSError: If the changed config could not be written
+    """
+    config = read_wfm_config()
+    before = copy.deepcopy(config)
+    yield config
+    if config != before and not write_wfm_config(config):
+        raise OSError(f"Failed to write {get_wfm_config_path()}")
+
+
 def get_configured_repos() -> dict[str, str]:
     """Get all configured repositories.
 
     Returns:
         dict mapping repo name to local path (e.g., {"myrepo": "/path/to/repo"})
     """
-    config = read_wfm_config()
-    return config.get("repos", {})
+    return dict(_load_wfm_config().get("repos", {}))
 
 
 def get_repo_local_path(name: str, repo: str) -> "Path":
@@ -72,6 +158,12 @@ def get_repo_local_path(name: str, repo: str) -> "Path":
     return Path(repo).expanduser().resolve()
 
 
+def _resolve_repo_path(repo_name: str) -> Path:
+    """Resolve a configured repo's local path from the cached wfm.json."""
+    repo = _load_wfm_config()["repos"].get(repo_name, "")
+    return get_repo_local_path(repo_name, repo)
+
+
 def add_repo(name: str, repo: str) -> dict:
     """Add a repository to the config.
 
@@ -82,40 +174,40 @@ def add_repo(name: str, repo: str) -> dict:
     Returns:
         Result dict with status and message
     """
-    config = read_wfm_config()
-
     # Validate name (must be valid as skill prefix)
-    if not name or not name.isalnum() and "-" not in name:
+    if not name or _NAME_RE.match(name) is None:
         return {
             "status": "error",
-            "message": f"Invalid name '{name}'. Use alphanumeric characters only."
+            "message": f"Invalid name '{name}'. Use alphanumeric characters and hyphens only."
         }
 
-    # Check if name already exists
-    if name in config["repos"]:
+    try:
+        with mutate_wfm_config() as config:
+            # Check if name already exists
+            if name in config["repos"]:
+                return {
+                    "status": "error",
+                    "message": f"Repository '{name}' already exists. Use 'wfm repo remove {name}' first."
+                }
+
+            # Check if repo path is already configured under a different name
+            repo_to_name = {v: k for k, v in config["repos"].items()}
+            if repo in repo_to_name:
+                return {
+                    "status": "error",
+                    "message": f"Repository '{repo}' already configured as '{repo_to_name[repo]}'."
+                }
+
+            config["repos"][name] = repo
+    except OSError:
         return {
             "status": "error",
-            "message": f"Repository '{name}' already exists. Use 'wfm repo remove {name}' first."
+            "message": "Failed to write config"
         }
 
-    # Check if repo path is already configured under a different name
-    for existing_name, existing_repo in config["repos"].items():
-        if existing_repo == repo:
-            return {
-                "status": "error",
-                "message": f"Repository '{repo}' already configured as '{existing_name}'."
-            }
-
-    config["repos"][name] = repo
-
-    if write_wfm_config(config):
-        return {
-            "status": "success",
-            "message": f"Added repository '{name}' -> {repo}"
-        }
     return {
-        "status": "error",
-        "message": "Failed to write config"
+        "status": "success",
+        "message": f"Added repository '{name}' -> {repo}"
     }
 
 
@@ -128,42 +220,44 @@ def remove_repo(name: str) -> dict:
     Returns:
         Result dict with status and message
     """
-    config = read_wfm_config()
-
-    if name not in config["repos"]:
+    try:
+        with mutate_wfm_config() as config:
+            if name not in config["repos"]:
+                return {
+                    "status": "error",
+                    "message": f"Repository '{name}' not found"
+                }
+
+            removed_repo = config["repos"].pop(name)
+    except OSError:
         return {
             "status": "error",
-            "message": f"Repository '{name}' not found"
+            "message": "Failed to write config"
         }
 
-    removed_repo = config["repos"].pop(name)
-
     # Remove all symlinks for this repo
     links_result = remove_repo_links(name)
 
     # Clean up knowledge junctions wfm created inside the repo's skill dirs
-    from wfm import platform as plat
     repo_path = Path(removed_repo)
-    repo_skills = repo_path / "skills"
-    if repo_skills.exists():
-        for skill_dir in repo_skills.iterdir():
-            knowledge_link = skill_dir / "knowledge"
-            if plat.is_link(knowledge_link):
-                try:
-                    plat.remove_link(knowledge_link)
-                except Exception:
-                    pass
+    try:
+        with os.scandir(repo_path / "skills") as it:
+            skill_dirs = [entry.path for entry in it if entry.is_dir()]
+    except OSError:
+        skill_dirs = []
+    for skill_dir in skill_dirs:
+        knowledge_link = Path(skill_dir) / "knowledge"
+        if plat.is_link(knowledge_link):
+            try:
+                plat.remove_link(knowledge_link)
+            except Exception:
+                pass
 
-    if write_wfm_config(config):
-        return {
-            "status": "success",
-            "message": f"Removed repository '{name}' ({removed_repo})",
-            "removed_skills": links_result.get("removed_skills", []),
-            "removed_workflows": links_result.get("removed_workflows", []),
-        }
     return {
-        "status": "error",
-        "message": "Failed to write config"
+        "status": "success",
+        "message": f"Removed repository '{name}' ({removed_repo})",
+        "removed_skills": links_result.get("removed_skills", []),
+        "removed_workflows": links_result.get("removed_workflows", []),
     }
 
 
@@ -172,26 +266,47 @@ def remove_repo(name: str) -> dict:
 # Global Paths
 # =============================================================================
 
+@functools.cache
 def get_global_claude_path() -> Path:
-    """Get the global ~/.claude/ directory path."""
+    """Get the global ~/.claude/ directory path.
+
+    Cached for the process lifetime; call get_global_claude_path.cache_clear()
+    (and the same on dependent getters) if HOME changes.
+    """
     return Path.home() / ".claude"
 
 
+@functools.cache
 def get_global_skills_path() -> Path:
     """Get the global skills directory path (~/.claude/skills/)."""
     return get_global_claude_path() / "skills"
 
 
+@functools.cache
 def get_global_workflows_path() -> Path:
     """Get the global workflows directory path (~/.claude/workflows/)."""
     return get_global_claude_path() / "workflows"
 
 
+@functools.cache
 def get_global_knowledge_path() -> Path:
     """Get the global knowledge directory path (~/.claude/knowledge/)."""
     return get_global_claude_path() / "knowledge"
 
 
+# Directories already created (or found) by _ensure_dir in this process
+_ensured_dirs: set[str] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """mkdir -p path, at most once per process for each directory."""
+    key = os.fspath(path)
+    if key in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(key)
+
+
 def sync_repo_knowledge(repo_path: Path) -> bool:
     """Sync knowledge/ from repo root to ~/.claude/knowledge/ (issue #9).
 
@@ -203,8 +318,6 @@ def sync_repo_knowledge(repo_path: Path) -> bool:
     Returns:
         True if knowledge/ was synced, False if repo has no knowledge/ folder
     """
-    from wfm import platform as plat
-
     repo_knowledge = repo_path / "knowledge"
     if not repo_knowledge.is_dir():
         return False
@@ -279,19 +392,25 @@ def sync_all() -> dict:
     total_workflows = 0
     errors = []
 
+    # Repos are synced one at a time, in config order: repo names may overlap
+    # ("a" skill "b-x" and "a-b" skill "x" both link a-b-x) and every repo
+    # links the same ~/.claude/knowledge/, so the last repo must win.
+    # Links within a repo are created concurrently by create_*_links.
     for name, repo in repos.items():
-        result = sync_repo(name, repo)
-        results.append(result)
+        results.append(sync_repo(name, repo))
 
+    # Detect orphans
+    orphans = detect_orphans()
+    orphan_skills = orphans["skills"]
+    orphan_workflows = orphans["workflows"]
+
+    for name, result in zip(repos, results):
         if result["status"] == "success":
             total_skills += result.get("skills_count", 0)
             total_workflows += result.get("workflows_count", 0)
         else:
             errors.append(f"{name}: {result.get('message', 'Unknown error')}")
 
-    # Detect orphans
-    orphan_skills = detect_orphan_skills()
-    orphan_workflows = detect_orphan_workflows()
     ignored_skills = get_ignored_skills()
     ignored_workflows = get_ignored_workflows()
 
@@ -328,34 +447,61 @@ def sync_all() -> dict:
 
 def get_ignored_skills() -> list[str]:
     """Get list of ignored skills from wfm.json."""
-    config = read_wfm_config()
-    return config.get("ignored_skills", [])
+    return list(_load_wfm_config().get("ignored_skills", []))
 
 
 def get_ignored_workflows() -> list[str]:
     """Get list of ignored workflows from wfm.json."""
-    config = read_wfm_config()
-    return config.get("ignored_workflows", [])
+    return list(_load_wfm_config().get("ignored_workflows", []))
+
+
+def _add_ignored(key: str, names: Iterable[str]) -> None:
+    """Append names missing from the wfm.json list at key, in one write."""
+    # Best effort, like the rest of the ignore bookkeeping: a failed write is
+    # not fatal, the user is simply asked again next time
+    with contextlib.suppress(OSError), mutate_wfm_config() as config:
+        ignored = config.setdefault(key, [])
+        existing = set(ignored)
+        for name in names:
+            if name not in existing:
+                ignored.append(name)
+                existing.add(name)
+
+
+def ignore_skills(skill_names: Iterable[str]) -> None:
+    """Add skills to the ignored_skills list in wfm.json."""
+    _add_ignored("ignored_skills", skill_names)
+
+
+def ignore_workflows(workflow_names: Iterable[str]) -> None:
+    """Add workflows to the ignored_workflows list in wfm.json."""
+    _add_ignored("ignored_workflows", workflow_names)
 
 
 def ignore_skill(skill_name: str) -> None:
     """Add a skill to the ignored_skills list in wfm.json."""
-    config = read_wfm_config()
-    if "ignored_skills" not in config:
-        config["ignored_skills"] = []
-    if skill_name not in config["ignored_skills"]:
-        config["ignored_skills"].append(skill_name)
-    write_wfm_config(config)
+    ignore_skills([skill_name])
 
 
 def ignore_workflow(workflow_name: str) -> None:
     """Add a workflow to the ignored_workflows list in wfm.json."""
-    config = read_wfm_config()
-    if "ignored_workflows" not in config:
-        config["ignored_workflows"] = []
-    if workflow_name not in config["ignored_workflows"]:
-        config["ignored_workflows"].append(workflow_name)
-    write_wfm_config(config)
+    ignore_workflows([workflow_name])
+
+
+def _map_concurrently(fn: Callable, items: list) -> list:
+    """Apply fn to each item on a small thread pool, keeping the input order.
+
+    Used for the per-link work of a single repo, which is syscall/subprocess
+    bound (each link is a mklink subprocess on Windows). Callers must not
+    nest it: sync_all syncs repos serially so at most one pool is alive.
+    """
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+        return list(executor.map(fn, items))
 
 
 def create_skill_links(repo_name: str, repo_path: "Path") -> list[str]:
@@ -370,8 +516,6 @@ def create_skill_links(repo_name: str, repo_path: "Path") -> list[str]:
     Returns:
         List of created skill link names
     """
-    from wfm import platform as plat
-
     repo_skills_path = repo_path / "skills"
     global_skills_path = get_global_skills_path()
 
@@ -381,37 +525,62 @@ def create_skill_links(repo_name: str, repo_path: "Path") -> list[str]:
         return created
 
     # Ensure global skills directory exists
-    global_skills_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(global_skills_path)
+
+    # Probe knowledge/ once per repo rather than once per skill
+    knowledge_target = repo_path / "knowledge"
+    has_knowledge = knowledge_target.exists()
+
+    # Collect skill dirs (those holding a SKILL.md) in a single scandir pass
+    with os.scandir(repo_skills_path) as it:
+        skill_dirs = [
+            (entry.name, entry.path)
+            for entry in it
+            if os.path.exists(os.path.join(entry.path, "SKILL.md"))
+        ]
+
+    prefix = f"{repo_name}-"
+
+    # Two skill dirs can share a link name ("x" and "<repo>-x"): group them so
+    # each link is written by one worker, in scandir order (last one wins)
+    groups: dict[str, list[tuple[str, str]]] = {}
+    for skill_name, skill_dir in skill_dirs:
+        # Skip prefix if skill name already starts with repo name
+        if skill_name.startswith(prefix):
+            link_name = skill_name
+        else:
+            link_name = prefix + skill_name
+        groups.setdefault(link_name, []).append((skill_name, skill_dir))
 
-    # Create links for each skill in the repo
-    for skill_dir in repo_skills_path.iterdir():
-        if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
-            # Skip prefix if skill name already starts with repo name
-            if skill_dir.name.startswith(f"{repo_name}-"):
-                link_name = skill_dir.name
-            else:
-                link_name = f"{repo_name}-{skill_dir.name}"
-            link_path = global_skills_path / link_name
+    def link_skill(link_name: str, skill_name: str, skill_dir: str) -> bool:
+        link_path = global_skills_path / link_name
 
-            try:
-                plat.create_link(skill_dir, link_path)
-                created.append(link_name)
-            except Exception as e:
-                print(f"Warning: Failed to create link for {link_name}: {e}")
-                continue
+        try:
+            plat.create_link(skill_dir, link_path, make_parents=False)
+        except Exception as e:
+            print(f"Warning: Failed to create link for {link_name}: {e}")
+            return False
+
+        # Create knowledge junction inside skill dir (issues #8/#10).
+        # On Windows, git symlinks inside skill dirs are stored as text files.
+        # wfm creates a real junction so knowledge/ resolves correctly.
+        if has_knowledge:
+            knowledge_link = os.path.join(skill_dir, "knowledge")
+            if not plat.is_link(knowledge_link) and not os.path.exists(knowledge_link):
+                try:
+                    plat.create_link(knowledge_target, knowledge_link, make_parents=False)
+                except Exception as e:
+                    print(f"Warning: Failed to create knowledge link in {skill_name}: {e}")
 
-            # Create knowledge junction inside skill dir (issues #8/#10).
-            # On Windows, git symlinks inside skill dirs are stored as text files.
-            # wfm creates a real junction so knowledge/ resolves correctly.
-            knowledge_target = repo_path / "knowledge"
-            if knowledge_target.exists():
-                knowledge_link = skill_dir / "knowledge"
-                if not plat.is_link(knowledge_link) and not knowledge_link.exists():
-                    try:
-                        plat.create_link(knowledge_target, knowledge_link)
-                    except Exception as e:
-                        print(f"Warning: Failed to create knowledge link in {skill_dir.name}: {e}")
+        return True
 
+    def link_group(item: tuple[str, list[tuple[str, str]]]) -> list[str]:
+        link_name, members = item
+        return [link_name for skill_name, skill_dir in members if link_skill(link_name, skill_name, skill_dir)]
+
+    # Create links for each skill in the repo
+    for names in _map_concurrently(link_group, list(groups.items())):
+        created.extend(names)
     return created
 
 
@@ -427,8 +596,6 @@ def create_workflow_links(repo_name: str, repo_path: "Path") -> list[str]:
     Returns:
         List of created workflow link names
     """
-    from wfm import platform as plat
-
     repo_workflows_path = repo_path / "workflows"
     global_workflows_path = get_global_workflows_path()
 
@@ -438,24 +605,44 @@ def create_workflow_links(repo_name: str, repo_path: "Path") -> list[str]:
         return created
 
     # Ensure global workflows directory exists
-    global_workflows_path.mkdir(parents=True, exist_ok=True)
-
-    # Create links for each workflow in the repo
-    for wf_dir in repo_workflows_path.iterdir():
-        if wf_dir.is_dir() and (wf_dir / "workflow.md").exists():
-            # Skip prefix if workflow name already starts with repo name
-            if wf_dir.name.startswith(f"{repo_name}-"):
-                link_name = wf_dir.name
-            else:
-                link_name = f"{repo_name}-{wf_dir.name}"
-            link_path = global_workflows_path / link_name
-
+    _ensure_dir(global_workflows_path)
+
+    # Collect workflow dirs (those holding a workflow.md) in a single scandir pass
+    with os.scandir(repo_workflows_path) as it:
+        wf_dirs = [
+            (entry.name, entry.path)
+            for entry in it
+            if os.path.exists(os.path.join(entry.path, "workflow.md"))
+        ]
+
+    prefix = f"{repo_name}-"
+
+    # Two workflow dirs can share a link name ("x" and "<repo>-x"): group them
+    # so each link is written by one worker, in scandir order (last one wins)
+    groups: dict[str, list[str]] = {}
+    for wf_name, wf_dir in wf_dirs:
+        # Skip prefix if workflow name already starts with repo name
+        if wf_name.startswith(prefix):
+            link_name = wf_name
+        else:
+            link_name = prefix + wf_name
+        groups.setdefault(link_name, []).append(wf_dir)
+
+    def link_group(item: tuple[str, list[str]]) -> list[str]:
+        link_name, members = item
+        link_path = global_workflows_path / link_name
+        linked = []
+        for wf_dir in members:
             try:
-                plat.create_link(wf_dir, link_path)
-                created.append(link_name)
+                plat.create_link(wf_dir, link_path, make_parents=False)
+                linked.append(link_name)
             except Exception as e:
                 print(f"Warning: Failed to create link for {link_name}: {e}")
+        return linked
 
+    # Create links for each workflow in the repo
+    for names in _map_concurrently(link_group, list(groups.items())):
+        created.extend(names)
     return created
 
 
@@ -468,33 +655,34 @@ def remove_repo_links(repo_name: str) -> dict:
     Returns:
         Dict with removed skills and workflows counts
     """
-    from wfm import platform as plat
-
     skills_path = get_global_skills_path()
     workflows_path = get_global_workflows_path()
 
     removed_skills = []
     removed_workflows = []
 
+    # Only entries carrying this repo's prefix are candidates; filter by name
+    # before asking whether they are links
+    prefix = f"{repo_name}-"
+
+    def unlink(entry: os.DirEntry) -> str | None:
+        try:
+            plat.remove_link(entry.path)
+        except Exception:
+            return None
+        return entry.name
+
     # Remove skill links
     if skills_path.exists():
-        for item in skills_path.iterdir():
-            if item.name.startswith(f"{repo_name}-") and plat.is_link(item):
-                try:
-                    plat.remove_link(item)
-                    removed_skills.append(item.name)
-                except Exception:
-                    pass
+        with os.scandir(skills_path) as it:
+            links = [entry for entry in it if entry.name.startswith(prefix) and plat.is_link_entry(entry)]
+        removed_skills = [name for name in _map_concurrently(unlink, links) if name is not None]
 
     # Remove workflow links
     if workflows_path.exists():
-        for item in workflows_path.iterdir():
-            if item.name.startswith(f"{repo_name}-") and plat.is_link(item):
-                try:
-                    plat.remove_link(item)
-                    removed_workflows.append(item.name)
-                except Exception:
-                    pass
+        with os.scandir(workflows_path) as it:
+            links = [entry for entry in it if entry.name.startswith(prefix) and plat.is_link_entry(entry)]
+        removed_workflows = [name for name in _map_concurrently(unlink, links) if name is not None]
 
     return {
         "removed_skills": removed_skills,
@@ -502,64 +690,88 @@ def remove_repo_links(repo_name: str) -> dict:
     }
 
 
-def detect_orphan_skills() -> list[str]:
-    """Detect skills that are directories (not symlinks/junctions).
+def _iter_orphans(base_path: Path, marker: str, ignored: frozenset[str]) -> Iterator[str]:
+    """Yield real directories under base_path that contain marker.
 
-    These are skills created locally (e.g., via builder) that aren't linked to a repo.
+    Links (managed by wfm) and ignored names are skipped. The link test uses
+    the attributes os.scandir already fetched, so each entry costs at most
+    one extra stat, for the marker. Names are yielded as the scan goes, so
+    a caller that stops early skips the rest of the directory.
+    """
+    try:
+        it = os.scandir(base_path)
+    except FileNotFoundError:
+        return
+
+    with it:
+        for entry in it:
+            # Skip if ignored
+            if entry.name in ignored:
+                continue
+            # Skip if it's a link (managed by wfm)
+            if plat.is_link_entry(entry):
+                continue
+            if os.path.exists(os.path.join(entry.path, marker)):
+                yield entry.name
+
+
+def detect_orphans() -> dict:
+    """Detect orphan skills and workflows in one pass over wfm.json.
 
     Returns:
-        List of orphan skill names
+        Dict with 'skills' and 'workflows' lists of orphan names
     """
-    from wfm import platform as plat
+    config = _load_wfm_config()
+    return {
+        "skills": list(_iter_orphans(
+            get_global_skills_path(), "SKILL.md", frozenset(config.get("ignored_skills", ()))
+        )),
+        "workflows": list(_iter_orphans(
+            get_global_workflows_path(), "workflow.md", frozenset(config.get("ignored_workflows", ()))
+        )),
+    }
 
-    skills_path = get_global_skills_path()
-    orphans = []
 
-    if not skills_path.exists():
-        return orphans
+def iter_orphan_skills() -> Iterator[str]:
+    """Lazily yield orphan skill names, e.g. for any(iter_orphan_skills())."""
+    return _iter_orphans(get_global_skills_path(), "SKILL.md", frozenset(get_ignored_skills()))
 
-    ignored = get_ignored_skills()
 
-    for item in skills_path.iterdir():
-        if item.is_dir() and (item / "SKILL.md").exists():
-            # Skip if it's a link (managed by wfm)
-            if plat.is_link(item):
-                continue
-            # Skip if ignored
-            if item.name in ignored:
-                continue
-            orphans.append(item.name)
+def iter_orphan_workflows() -> Iterator[str]:
+    """Lazily yield orphan workflow names, e.g. for any(iter_orphan_workflows())."""
+    return _iter_orphans(get_global_workflows_path(), "workflow.md", frozenset(get_ignored_workflows()))
 
-    return orphans
 
+def detect_orphan_skills() -> list[str]:
+    """Detect skills that are directories (not symlinks/junctions).
 
-def detect_orphan_workflows() -> list[str]:
-    """Detect workflows that are directories (not symlinks/junctions).
+    These are skills created locally (e.g., via builder) that aren't linked to a repo.
 
     Returns:
-        List of orphan workflow names
+        List of orphan skill names
     """
-    from wfm import platform as plat
+    return list(iter_orphan_skills())
 
-    workflows_path = get_global_workflows_path()
-    orphans = []
 
-    if not workflows_path.exists():
-        return orphans
+def detect_orphan_workflows() -> list[str]:
+    """Detect workflows that are directories (not symlinks/junctions).
 
-    ignored = get_ignored_workflows()
+    Returns:
+        List of orphan workflow names
+    """
+    return list(iter_orphan_workflows())
 
-    for item in workflows_path.iterdir():
-        if item.is_dir() and (item / "workflow.md").exists():
-            # Skip if it's a link (managed by wfm)
-            if plat.is_link(item):
-                continue
-            # Skip if ignored
-            if item.name in ignored:
-                continue
-            orphans.append(item.name)
 
-    return orphans
+def _move_dir(source: Path, target: Path) -> None:
+    """Move a directory, renaming in place when source and target share a filesystem."""
+    try:
+        os.rename(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Different filesystems: fall back to copy + delete
+        import shutil
+        shutil.move(str(source), str(target))
 
 
 def adopt_skill(skill_name: str, repo_name: str) -> dict:
@@ -572,35 +784,31 @@ def adopt_skill(skill_name: str, repo_name: str) -> dict:
     Returns:
         Result dict with status
     """
-    from wfm import platform as plat
-
     skills_path = get_global_skills_path()
-    repos = get_configured_repos()
-    repo = repos.get(repo_name, "")
 
     skill_path = skills_path / skill_name
-    repo_path = get_repo_local_path(repo_name, repo)
+    repo_path = _resolve_repo_path(repo_name)
     repo_skills_path = repo_path / "skills"
 
     # Validate
-    if not skill_path.exists():
+    if not os.path.exists(skill_path):
         return {"status": "error", "message": f"Skill '{skill_name}' not found"}
 
     if plat.is_link(skill_path):
         return {"status": "error", "message": f"Skill '{skill_name}' is already a link"}
 
-    if not repo_path.exists():
+    if not os.path.exists(repo_path):
         return {"status": "error", "message": f"Repository '{repo_name}' not found"}
 
     target_skill_path = repo_skills_path / skill_name
 
     # Move skill to repo
-    repo_skills_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(repo_skills_path)
 
-    if target_skill_path.exists():
+    if os.path.exists(target_skill_path):
         return {"status": "error", "message": f"Skill '{skill_name}' already exists in repo '{repo_name}'"}
 
-    shutil.move(str(skill_path), str(target_skill_path))
+    _move_dir(skill_path, target_skill_path)
 
     # Create link back with repo prefix
     link_name = f"{repo_name}-{skill_name}"
@@ -630,35 +838,31 @@ def adopt_workflow(workflow_name: str, repo_name: str) -> dict:
     Returns:
         Result dict with status
     """
-    from wfm import platform as plat
-
     workflows_path = get_global_workflows_path()
-    repos = get_configured_repos()
-    repo = repos.get(repo_name, "")
 
     workflow_path = workflows_path / workflow_name
-    repo_path = get_repo_local_path(repo_name, repo)
+    repo_path = _resolve_repo_path(repo_name)
     repo_workflows_path = repo_path / "workflows"
 
     # Validate
-    if not workflow_path.exists():
+    if not os.path.exists(workflow_path):
         return {"status": "error", "message": f"Workflow '{workflow_name}' not found"}
 
     if plat.is_link(workflow_path):
         return {"status": "error", "message": f"Workflow '{workflow_name}' is already a link"}
 
-    if not repo_path.exists():
+    if not os.path.exists(repo_path):
         return {"status": "error", "message": f"Repository '{repo_name}' not found"}
 
     target_workflow_path = repo_workflows_path / workflow_name
 
     # Move workflow to repo
-    repo_workflows_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(repo_workflows_path)
 
-    if target_workflow_path.exists():
+    if os.path.exists(target_workflow_path):
         return {"status": "error", "message": f"Workflow '{workflow_name}' already exists in repo '{repo_name}'"}
 
-    shutil.move(str(workflow_path), str(target_workflow_path))
+    _move_dir(workflow_path, target_workflow_path)
 
     # Create link back with repo prefix
     link_name = f"{repo_name}-{workflow_name}"